@@ -5,14 +5,34 @@ Simple Python library for interacting with Locus MCP server
 
 import json
 import requests
+from http.cookiejar import DefaultCookiePolicy
 from typing import Optional, Dict, Any
 
 
+def _build_session() -> requests.Session:
+    """Create an HTTP session shared by all LocusClient instances"""
+    session = requests.Session()
+    # Never persist cookies: the session is shared across API keys, so a
+    # cookie set for one key must not be sent with another key's payments
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# Reused across clients so repeated calls keep the TLS connection alive.
+# requests.Session is not guaranteed thread-safe, and every client shares this
+# one, so serialize calls when sending payments from multiple threads.
+_SESSION = _build_session()
+
+
 class LocusClient:
     """Client for interacting with Locus MCP server"""
     
     MCP_URL = "https://mcp.paywithlocus.com/mcp"
     
+    # (connect, read) timeouts: fail fast on unreachable hosts while still
+    # allowing slow payment tool calls their full read budget
+    TIMEOUT = (5, 30)
+    
     def __init__(self, api_key: str):
         """
         Initialize Locus client
@@ -45,29 +65,30 @@ class LocusClient:
             "params": params or {}
         }
         
-        response = requests.post(
+        # Context manager releases the streamed connection back to the pool
+        with _SESSION.post(
             self.MCP_URL,
             headers=self.headers,
             json=payload,
-            timeout=30,
+            timeout=self.TIMEOUT,
             stream=True
-        )
-        response.raise_for_status()
-        
-        # Handle SSE streaming response
-        content_type = response.headers.get('Content-Type', '').lower()
-        if 'text/event-stream' in content_type:
-            for line in response.iter_lines():
-                if line:
-                    line_str = line.decode('utf-8')
-                    if line_str.startswith('data: '):
-                        try:
-                            return json.loads(line_str[6:])  # Remove 'data: ' prefix
-                        except json.JSONDecodeError:
-                            continue
-            raise ValueError("No valid JSON data found in SSE stream")
-        else:
-            return response.json()
+        ) as response:
+            response.raise_for_status()
+            
+            # Handle SSE streaming response
+            content_type = response.headers.get('Content-Type', '').lower()
+            if 'text/event-stream' in content_type:
+                for line in response.iter_lines():
+                    if line:
+                        line_str = line.decode('utf-8')
+                        if line_str.startswith('data: '):
+                            try:
+                                return json.loads(line_str[6:])  # Remove 'data: ' prefix
+                            except json.JSONDecodeError:
+                                continue
+                raise ValueError("No valid JSON data found in SSE stream")
+            else:
+                return response.json()
     
     def list_tools(self) -> list:
         """